@@ -1,11 +1,12 @@
 import os.path as osp
-from typing import Any, Dict, Hashable, Mapping, Optional
+from typing import Any, Dict, Generator, Hashable, Iterable, Mapping, Optional, Tuple
 
 import numpy
 
 from smqtk_dataprovider.utils.file import safe_create_dir
 from smqtk_dataprovider.utils.string import partition_string
 from smqtk_descriptors import DescriptorElement
+from smqtk_descriptors.utils.vector_retrieval import parallel_uuids_and_vectors
 
 
 class DescriptorFileElement (DescriptorElement):  # lgtm [py/missing-equals]
@@ -83,6 +84,14 @@ class DescriptorFileElement (DescriptorElement):  # lgtm [py/missing-equals]
         self._subdir_split = state['_subdir_split']
         self._vec_filepath = state['_vec_filepath']
 
+    @classmethod
+    def _get_many_vectors(
+        cls,
+        descriptors: Iterable["DescriptorElement"]
+    ) -> Generator[Tuple[Hashable, Optional[numpy.ndarray]], None, None]:
+        # Vectors are loaded from disk, so retrieve them in parallel.
+        yield from parallel_uuids_and_vectors(descriptors)
+
     def get_config(self) -> Dict[str, Any]:
         return {
             "save_dir": self._save_dir,
@@ -1,5 +1,5 @@
 from io import BytesIO
-from typing import Any, Dict, Generator, Hashable, Iterable, Mapping, Optional, Sequence, Tuple, Union
+from typing import cast, Any, Dict, Generator, Hashable, Iterable, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy
 
@@ -16,6 +16,8 @@ class DescriptorMemoryElement (DescriptorElement):  # lgtm [py/missing-equals]
     >>> self = DescriptorMemoryElement(0)
     """
 
+    __slots__ = ("__v",)
+
     @classmethod
     def is_usable(cls) -> bool:
         return True
@@ -29,9 +31,31 @@ class DescriptorMemoryElement (DescriptorElement):  # lgtm [py/missing-equals]
         cls,
         descriptors: Iterable["DescriptorElement"]
     ) -> Generator[Tuple[Hashable, Optional[numpy.ndarray]], None, None]:
-        # Memory elements are super simple.
-        for d in descriptors:
-            yield d.uuid(), d.vector()
+        """
+        Return the UUIDs and vectors of the given in-memory descriptors.
+
+        When neither ``uuid`` nor ``vector`` is overridden by this class,
+        stored attributes are accessed directly instead of calling those
+        methods per element. Vectors are copied to maintain the same
+        immutability as ``vector``.
+
+        :note: All given descriptors must be instances of this exact class,
+            as is the case for batches formed by `get_many_vectors`.
+
+        :param descriptors: Iterable of descriptors to query for.
+
+        :return: Iterator of tuples containing the descriptor uuid and the
+            vector associated with the given descriptors or None if the
+            descriptor has no associated vector
+        """
+        if cls.vector is not DescriptorMemoryElement.vector or cls.uuid is not DescriptorElement.uuid:
+            # Respect subclass accessor overrides.
+            for d in descriptors:
+                yield d.uuid(), d.vector()
+            return
+        for d in cast(Iterable[DescriptorMemoryElement], descriptors):
+            v = d.__v
+            yield d._uuid, (None if v is None else numpy.copy(v))
 
     def __getstate__(self) -> Dict[str, Any]:
         state = super(DescriptorMemoryElement, self).__getstate__()
@@ -47,6 +71,7 @@ class DescriptorMemoryElement (DescriptorElement):  # lgtm [py/missing-equals]
         if isinstance(state, Sequence):
             # Could state ever be a str/bytes instance? That would cause a problem if so.
             self._uuid = state[0]
+            self._hash = hash(self._uuid)
             b = BytesIO(state[1])
         else:  # dictionary
             super(DescriptorMemoryElement, self).__setstate__(state)
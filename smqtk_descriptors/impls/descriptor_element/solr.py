@@ -1,9 +1,10 @@
 import time
-from typing import Any, Dict, Hashable, Mapping, Optional
+from typing import Any, Dict, Generator, Hashable, Iterable, Mapping, Optional, Tuple
 
 import numpy
 
 from smqtk_descriptors import DescriptorElement
+from smqtk_descriptors.utils.vector_retrieval import parallel_uuids_and_vectors
 
 
 # Try to import required module
@@ -84,6 +85,7 @@ class SolrDescriptorElement (DescriptorElement):  # lgtm [py/missing-equals]
         return state
 
     def __setstate__(self, state: Mapping[str, Any]) -> None:
+        super(SolrDescriptorElement, self).__setstate__(state)
         self.uuid_field = state['uuid_field']
         self.vector_field = state['vector_field']
         self.timestamp_field = state['timestamp_field']
@@ -131,6 +133,14 @@ class SolrDescriptorElement (DescriptorElement):  # lgtm [py/missing-equals]
         else:
             return None
 
+    @classmethod
+    def _get_many_vectors(
+        cls,
+        descriptors: Iterable["DescriptorElement"]
+    ) -> Generator[Tuple[Hashable, Optional[numpy.ndarray]], None, None]:
+        # Each vector is a separate Solr query, so retrieve them in parallel.
+        yield from parallel_uuids_and_vectors(descriptors)
+
     def get_config(self) -> Dict[str, Any]:
         return {
             "solr_conn_addr": self.solr_conn_addr,
@@ -1,29 +1,79 @@
 import abc
-from collections import defaultdict
-from typing import Any, Dict, Generator, Hashable, Iterable, List, Mapping, Optional, Tuple, Type, TypeVar
+from typing import (
+    Any, Callable, Dict, Generator, Hashable, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple, Type,
+    TypeVar, Union, overload
+)
 
 import numpy
 
 from smqtk_core import Configurable, Pluggable
-from smqtk_core.dict import merge_dict
-from smqtk_descriptors.utils.parallel import parallel_map
 
 
 T = TypeVar("T", bound="DescriptorElement")
 
 
-def _uuid_and_vector_from_descriptor(
-    descriptor: "DescriptorElement"
-) -> Tuple[Hashable, Optional[numpy.ndarray]]:
+def _vectors_equal(v1: numpy.ndarray, v2: numpy.ndarray) -> bool:
     """
-    Given a descriptor, return a tuple containing the UUID and associated
-    vector for that descriptor
+    Test two descriptor vectors for element-wise equality.
 
-    :param descriptor: The descriptor to process.
-    :return: Tuple containing the UUID and associated vector for the given
-        descriptor
+    Unlike ``numpy.array_equal``, inputs are assumed to already be arrays, so
+    no conversion is performed, and arrays of differing shape are rejected
+    before any element is compared.
+
+    Contiguous boolean or integer vectors of the same type are compared by
+    their raw bytes, avoiding the intermediate boolean array. This is not
+    applied to floating point types, where byte equality differs from value
+    equality (e.g. ``0.0 == -0.0`` and ``nan != nan``).
+
+    :param v1: First vector.
+    :param v2: Second vector.
+    :return: If the two vectors are of the same shape and equal values.
     """
-    return descriptor.uuid(), descriptor.vector()
+    if v1.shape != v2.shape:
+        return False
+    if (
+        v1.dtype == v2.dtype and v1.dtype.kind in "biu"
+        and v1.flags.c_contiguous and v2.flags.c_contiguous
+    ):
+        return v1.tobytes() == v2.tobytes()
+    return bool((v1 == v2).all())
+
+
+def _batch_by_type(
+    descriptors: List["DescriptorElement"]
+) -> List[Tuple[Type["DescriptorElement"], Sequence[int], List["DescriptorElement"]]]:
+    """
+    Divide descriptors up into batches based on their type, since each
+    DescriptorElement subclass knows best how to optimally retrieve vectors of
+    its own type.
+
+    :param descriptors: List of descriptors to batch.
+    :return: List of tuples containing a descriptor type, the positions in
+        the input list of the descriptors of that type and those descriptors,
+        respectively.
+    """
+    if not descriptors:
+        return []
+
+    # Common case of a homogeneous batch: skip the per-type grouping below.
+    first_type = type(descriptors[0])
+    for descriptor_ in descriptors:
+        if type(descriptor_) is not first_type:
+            break
+    else:
+        return [(first_type, range(len(descriptors)), descriptors)]
+
+    batch_dictionary: Dict[Type[DescriptorElement], Tuple[List[int], List[DescriptorElement]]] = {}
+    for index, descriptor_ in enumerate(descriptors):
+        # Keep track of each descriptor's position to ensure that vectors may
+        # be returned in the requested order after batching them out.
+        descriptor_type = type(descriptor_)
+        group = batch_dictionary.get(descriptor_type)
+        if group is None:
+            group = batch_dictionary[descriptor_type] = ([], [])
+        group[0].append(index)
+        group[1].append(descriptor_)
+    return [(t, indices, batch) for t, (indices, batch) in batch_dictionary.items()]
 
 
 class DescriptorElement (Configurable, Pluggable):
@@ -41,8 +91,15 @@ class DescriptorElement (Configurable, Pluggable):
     up for discussion).
 
     Stored vectors should be effectively immutable.
+
+    Instance attributes of this base class are stored in ``__slots__``.
+    Implementations that are expected to be instantiated in large numbers
+    should also declare ``__slots__`` for their own attributes, otherwise
+    instances will still carry a per-instance ``__dict__``.
     """
 
+    __slots__ = ("_uuid", "_hash", "__weakref__")
+
     def __init__(self, uuid: Hashable):
         """
         Initialize a new descriptor element.
@@ -52,13 +109,28 @@ class DescriptorElement (Configurable, Pluggable):
         super(DescriptorElement, self).__init__()
 
         self._uuid = uuid
+        # UUIDs are fixed for the lifetime of an element, so the hash is
+        # computed once here instead of on every set/dict operation.
+        self._hash = hash(uuid)
 
     def __hash__(self) -> int:
-        return hash(self.uuid())
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, DescriptorElement):
-            return numpy.array_equal(self.vector(), other.vector())  # type: ignore
+            v1 = self.vector()
+            if v1 is None:
+                # Equal only if the other element also lacks a vector, which
+                # does not require retrieving the other's vector.
+                return not other.has_vector()
+            v2 = other.vector()
+            if v1 is v2:
+                return True
+            if v2 is None:
+                return False
+            return _vectors_equal(v1, v2)
         return False
 
     def __ne__(self, other: Any) -> bool:
@@ -74,6 +146,7 @@ class DescriptorElement (Configurable, Pluggable):
 
     def __setstate__(self, state: Mapping[str, Any]) -> None:
         self._uuid = state['_uuid']
+        self._hash = hash(self._uuid)
 
     @classmethod
     def get_default_config(cls) -> Dict[str, Any]:
@@ -120,9 +193,10 @@ class DescriptorElement (Configurable, Pluggable):
 
         :return: Constructed instance from the provided config.
         """
-        c: Dict[str, Any] = {}
-        merge_dict(c, config_dict)
-        c['uuid'] = uuid
+        # Shallow copy so as to not modify the input dictionary. This is
+        # equivalent to merging into an empty dictionary, which never
+        # recurses into nested values.
+        c: Dict[str, Any] = {**config_dict, 'uuid': uuid}
         return super(DescriptorElement, cls).from_config(c, merge_default)
 
     def uuid(self) -> Hashable:
@@ -146,19 +220,73 @@ class DescriptorElement (Configurable, Pluggable):
             `get_many_vectors` handles re-ordering as necessary and insertion
             of None for missing values.
 
+        :note: The default implementation serially queries each descriptor.
+            Implementations whose ``vector`` access involves I/O should
+            override this method to batch or parallelize retrieval.
+
         :param descriptors: Iterable of descriptors to query for.
 
         :return: Iterator of tuples containing the descriptor uuid and the
             vector associated with the given descriptors or None if the
             descriptor has no associated vector
         """
-        for uuid_vector_pair in parallel_map(
-                _uuid_and_vector_from_descriptor, descriptors,
-                name='retrieve_vectors'):
-            yield uuid_vector_pair
+        for d in descriptors:
+            yield d.uuid(), d.vector()
 
     @classmethod
-    def get_many_vectors(cls, descriptors: Iterable["DescriptorElement"]) -> List[Optional[numpy.ndarray]]:
+    def _get_many_vectors_bulk(
+        cls,
+        descriptors: List["DescriptorElement"]
+    ) -> Optional[Tuple[Iterable[Hashable], numpy.ndarray]]:
+        """
+        Optional internal method that subclasses may override to return many
+        vectors as a single dense matrix instead of individual arrays.
+
+        When this returns a result, `_get_many_vectors` is not called for the
+        given descriptors and the wrapper functions place vectors with
+        vectorized indexing operations where possible.
+
+        :note: Only descriptors that have a vector should be represented in
+            the returned results, which need not be in the order requested.
+
+        :param descriptors: List of descriptors to query for.
+
+        :return: None if bulk retrieval is not supported, otherwise a tuple
+            of the UUIDs of descriptors with vectors and a matrix whose rows
+            are the vectors associated with those UUIDs, respectively.
+        """
+        return None
+
+    @overload
+    @classmethod
+    def get_many_vectors(
+        cls,
+        descriptors: Iterable["DescriptorElement"],
+        as_array: Literal[False] = ...
+    ) -> List[Optional[numpy.ndarray]]: ...
+
+    @overload
+    @classmethod
+    def get_many_vectors(
+        cls,
+        descriptors: Iterable["DescriptorElement"],
+        as_array: Literal[True]
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]: ...
+
+    @overload
+    @classmethod
+    def get_many_vectors(
+        cls,
+        descriptors: Iterable["DescriptorElement"],
+        as_array: bool
+    ) -> Union[List[Optional[numpy.ndarray]], Tuple[numpy.ndarray, numpy.ndarray]]: ...
+
+    @classmethod
+    def get_many_vectors(
+        cls,
+        descriptors: Iterable["DescriptorElement"],
+        as_array: bool = False
+    ) -> Union[List[Optional[numpy.ndarray]], Tuple[numpy.ndarray, numpy.ndarray]]:
         """
         Get an iterator over vectors associated with given descriptors.
 
@@ -169,36 +297,125 @@ class DescriptorElement (Configurable, Pluggable):
             subclass.
 
         :param descriptors: Iterable of descriptors to query for.
+        :param as_array: Return vectors as the rows of a single matrix along
+            with a mask of missing vectors, as described by
+            `get_many_vectors_array`, instead of as a list.
 
         :return: Iterable of vectors associated with the given descriptors or
             None if the descriptor has no associated vector. Results are
             returned in the order that descriptors were given.
         """
-        batch_dictionary = defaultdict(list)
-        uuid_indices = {}
-        index = -1
-        for index, descriptor_ in enumerate(descriptors):
-            # Divide descriptors up into batches based on their type, since
-            # each DescriptorElement subclass knows best how to optimally
-            # retrieve vectors of its own type.
-            batch_dictionary[type(descriptor_)].append(descriptor_)
-            # Keep track of the order of descriptors to ensure that we return
-            # vectors in the requested order after batching them out.
-            uuid_indices[descriptor_.uuid()] = index
+        if as_array:
+            return cls.get_many_vectors_array(descriptors)
+
+        descriptors = list(descriptors)
 
         # Default to None, since _get_many_vectors implementations can ignore
         # any descriptors that cannot be retrieved
-        ordered_vectors = [None] * (index + 1)  # type: List[Optional[numpy.ndarray]]
+        ordered_vectors = [None] * len(descriptors)  # type: List[Optional[numpy.ndarray]]
 
         # Retrieve all the vectors for a given type of descriptor in a single
         # batch
-        for _cls, descriptor_batch in batch_dictionary.items():
+        for _cls, indices, batch in _batch_by_type(descriptors):
             # noinspection PyProtectedMember
-            for uuid, vector in _cls._get_many_vectors(descriptor_batch):
-                ordered_vectors[uuid_indices[uuid]] = vector
+            bulk = _cls._get_many_vectors_bulk(batch)
+            get_vector: Callable[[Hashable], Optional[numpy.ndarray]]
+            if bulk is None:
+                # noinspection PyProtectedMember
+                get_vector = dict(_cls._get_many_vectors(batch)).get
+            else:
+                uuids, vectors = bulk
+                get_row = {uuid: row for row, uuid in enumerate(uuids)}.get
+
+                def get_vector(uuid: Hashable) -> Optional[numpy.ndarray]:
+                    # Copy rows so that returned vectors share memory neither
+                    # with each other nor with the bulk matrix.
+                    row = get_row(uuid)
+                    return None if row is None else vectors[row].copy()
+            if len(batch) == len(ordered_vectors):
+                # Homogeneous input, already in the requested order.
+                return [get_vector(d.uuid()) for d in batch]
+            for index, descriptor_ in zip(indices, batch):
+                ordered_vectors[index] = get_vector(descriptor_.uuid())
 
         return ordered_vectors
 
+    @classmethod
+    def get_many_vectors_array(
+        cls,
+        descriptors: Iterable["DescriptorElement"],
+        dtype: Any = None
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Get the vectors associated with given descriptors as the rows of a
+        single matrix.
+
+        Vectors are written into a matrix allocated once, avoiding an
+        additional stacking copy by the caller. Batches retrieved via
+        `_get_many_vectors_bulk` are placed with a single indexed assignment.
+        All retrieved vectors must be of the same shape.
+
+        :param descriptors: Iterable of descriptors to query for.
+        :param dtype: Optional numpy data type specification for the returned
+            matrix. By default, the type of the first retrieved vector is
+            used.
+
+        :raises ValueError: Retrieved vectors are not all of the same shape.
+
+        :return: Tuple of the ``N x D`` matrix of vectors, in the order that
+            descriptors were given, and a length ``N`` boolean mask that is
+            True for descriptors that have no associated vector. Rows for
+            descriptors without a vector are zero-filled. If no descriptor
+            has a vector, the matrix is of shape ``N x 0``.
+        """
+        descriptors = list(descriptors)
+        n = len(descriptors)
+        missing = numpy.ones(n, dtype=bool)
+        matrix = None  # type: Optional[numpy.ndarray]
+
+        def check_matrix(shape: Tuple[int, ...], vec_dtype: numpy.dtype) -> numpy.ndarray:
+            # Allocate on the first retrieved vector, since only then do we
+            # know the vector shape, otherwise check shape consistency.
+            nonlocal matrix
+            if matrix is None:
+                # Zero-initialized so rows of missing vectors hold a defined
+                # value.
+                matrix = numpy.zeros((n,) + shape, dtype=vec_dtype if dtype is None else dtype)
+            elif shape != matrix.shape[1:]:
+                raise ValueError(f"Retrieved vector shape {shape} does not match the shape of "
+                                 f"previously retrieved vectors {matrix.shape[1:]}.")
+            return matrix
+
+        for _cls, indices, batch in _batch_by_type(descriptors):
+            # noinspection PyProtectedMember
+            bulk = _cls._get_many_vectors_bulk(batch)
+            if bulk is None:
+                # noinspection PyProtectedMember
+                get_vector = dict(_cls._get_many_vectors(batch)).get
+                for index, descriptor_ in zip(indices, batch):
+                    vector = get_vector(descriptor_.uuid())
+                    if vector is not None:
+                        check_matrix(vector.shape, vector.dtype)[index] = vector
+                        missing[index] = False
+            else:
+                uuids, vectors = bulk
+                get_row = {uuid: row for row, uuid in enumerate(uuids)}.get
+                # Row of the bulk matrix for each descriptor in the batch, or
+                # -1 when no vector was returned for it.
+                rows = numpy.fromiter(
+                    (get_row(d.uuid(), -1) for d in batch),
+                    dtype=numpy.intp, count=len(batch)
+                )
+                found = rows >= 0
+                if found.any():
+                    positions = numpy.asarray(indices, dtype=numpy.intp)[found]
+                    check_matrix(vectors.shape[1:], vectors.dtype)[positions] = vectors[rows[found]]
+                    missing[positions] = False
+
+        if matrix is None:
+            matrix = numpy.zeros((n, 0), dtype=dtype)
+        return matrix, missing
+
     ###
     # Abstract methods
     #
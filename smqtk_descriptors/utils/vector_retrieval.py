@@ -0,0 +1,61 @@
+"""
+Utilities for retrieving vectors from descriptor elements whose vector access
+involves I/O, e.g. from disk or a remote service.
+"""
+from typing import Generator, Hashable, Iterable, Optional, Tuple
+
+import numpy
+
+from smqtk_descriptors.interfaces.descriptor_element import DescriptorElement
+from smqtk_descriptors.utils.parallel import parallel_map
+
+
+# Minimum number of descriptors in a batch for vectors to be retrieved in
+# parallel. Smaller batches are retrieved serially as worker startup would
+# dominate retrieving only a few vectors.
+PARALLEL_RETRIEVAL_THRESHOLD = 32
+
+
+def _uuid_and_vector_from_descriptor(
+    descriptor: DescriptorElement
+) -> Tuple[Hashable, Optional[numpy.ndarray]]:
+    """
+    Given a descriptor, return a tuple containing the UUID and associated
+    vector for that descriptor
+
+    :param descriptor: The descriptor to process.
+    :return: Tuple containing the UUID and associated vector for the given
+        descriptor
+    """
+    return descriptor.uuid(), descriptor.vector()
+
+
+def parallel_uuids_and_vectors(
+    descriptors: Iterable[DescriptorElement],
+    threshold: int = PARALLEL_RETRIEVAL_THRESHOLD
+) -> Generator[Tuple[Hashable, Optional[numpy.ndarray]], None, None]:
+    """
+    Retrieve the UUID and vector of each given descriptor, using
+    ``parallel_map`` for batches of at least ``threshold`` descriptors.
+
+    This is intended for use by ``DescriptorElement._get_many_vectors``
+    implementations whose ``vector`` method performs I/O.
+
+    :param descriptors: Iterable of descriptors to query for.
+    :param threshold: Minimum number of descriptors for retrieval to be
+        performed in parallel.
+
+    :return: Iterator of tuples containing the descriptor uuid and the vector
+        associated with the given descriptors or None if the descriptor has no
+        associated vector. Results are *not* guaranteed to be in the order
+        given.
+    """
+    descriptors = list(descriptors)
+    if len(descriptors) < threshold:
+        for d in descriptors:
+            yield _uuid_and_vector_from_descriptor(d)
+        return
+    for uuid_vector_pair in parallel_map(
+            _uuid_and_vector_from_descriptor, descriptors,
+            name='retrieve_vectors'):
+        yield uuid_vector_pair
@@ -6,6 +6,7 @@ import numpy
 
 from smqtk_core.configuration import configuration_test_helper
 from smqtk_descriptors.impls.descriptor_element.file import DescriptorFileElement
+from smqtk_descriptors.utils.vector_retrieval import PARALLEL_RETRIEVAL_THRESHOLD
 
 
 class TestDescriptorFileElement (unittest.TestCase):
@@ -82,3 +83,39 @@ class TestDescriptorFileElement (unittest.TestCase):
         v = numpy.zeros(16)
         mock_load.return_value = v
         numpy.testing.assert_equal(d.vector(), v)
+
+    def test_get_many_vectors(self) -> None:
+        d1 = DescriptorFileElement('a', '/base')
+        d2 = DescriptorFileElement('b', '/base')
+        v1 = numpy.zeros(4)
+        # noinspection PyTypeHints
+        d1.vector = mock.Mock(return_value=v1)  # type: ignore
+        # noinspection PyTypeHints
+        d2.vector = mock.Mock(return_value=None)  # type: ignore
+        r = DescriptorFileElement.get_many_vectors([d1, d2])
+        self.assertEqual(len(r), 2)
+        numpy.testing.assert_equal(r[0], v1)
+        self.assertIsNone(r[1])
+
+    @mock.patch('smqtk_descriptors.utils.vector_retrieval.parallel_map')
+    def test_get_many_vectors_small_batch_serial(self, m_pmap: mock.MagicMock) -> None:
+        # Batches under the threshold should not start parallel workers.
+        d = DescriptorFileElement('a', '/base')
+        # noinspection PyTypeHints
+        d.vector = mock.Mock(return_value=numpy.zeros(4))  # type: ignore
+        r = DescriptorFileElement.get_many_vectors([d])
+        numpy.testing.assert_equal(r[0], numpy.zeros(4))
+        m_pmap.assert_not_called()
+
+    @mock.patch('smqtk_descriptors.utils.vector_retrieval.parallel_map',
+                side_effect=lambda fn, it, **_: map(fn, it))
+    def test_get_many_vectors_large_batch_parallel(self, m_pmap: mock.MagicMock) -> None:
+        n = PARALLEL_RETRIEVAL_THRESHOLD
+        ds = [DescriptorFileElement(i, '/base') for i in range(n)]
+        for i, d in enumerate(ds):
+            # noinspection PyTypeHints
+            d.vector = mock.Mock(return_value=numpy.full(4, i))  # type: ignore
+        r = DescriptorFileElement.get_many_vectors(ds)
+        m_pmap.assert_called_once()
+        for i, v in enumerate(r):
+            numpy.testing.assert_equal(v, numpy.full(4, i))
@@ -1,6 +1,8 @@
 from io import BytesIO
 import pickle
 import unittest
+import weakref
+from typing import Optional
 
 import numpy
 
@@ -132,3 +134,35 @@ class TestDescriptorMemoryElement (unittest.TestCase):
         d.set_vector(None)
         self.assertFalse(d.has_vector())
         self.assertIs(d.vector(), None)
+
+    def test_slots(self) -> None:
+        # Memory elements are created in bulk and should not carry a
+        # per-instance attribute dictionary.
+        d = DescriptorMemoryElement(0)
+        self.assertFalse(hasattr(d, '__dict__'))
+
+    def test_weakref(self) -> None:
+        # Slots must not prevent weak references to elements.
+        d = DescriptorMemoryElement(0)
+        r = weakref.ref(d)
+        self.assertIs(r(), d)
+
+    def test_get_many_vectors(self) -> None:
+        d1 = DescriptorMemoryElement(0).set_vector(numpy.ones(4))
+        d2 = DescriptorMemoryElement(1)
+        r = DescriptorMemoryElement.get_many_vectors([d2, d1])
+        self.assertIsNone(r[0])
+        numpy.testing.assert_equal(r[1], numpy.ones(4))
+        # Retrieved vectors are copies of the stored vector.
+        assert r[1] is not None
+        r[1][:] = 0
+        numpy.testing.assert_equal(d1.vector(), numpy.ones(4))
+
+    def test_get_many_vectors_subclass_override(self) -> None:
+        # Subclass accessor overrides must not be bypassed.
+        class ZeroMemoryElement (DescriptorMemoryElement):
+            def vector(self) -> Optional[numpy.ndarray]:
+                return numpy.zeros(2)
+
+        r = DescriptorMemoryElement.get_many_vectors([ZeroMemoryElement(0)])
+        numpy.testing.assert_equal(r[0], numpy.zeros(2))
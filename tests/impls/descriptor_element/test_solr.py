@@ -1,10 +1,12 @@
 import unittest
 
 import unittest.mock as mock
+import numpy
 import pytest
 
 from smqtk_core.configuration import configuration_test_helper
 from smqtk_descriptors.impls.descriptor_element.solr import SolrDescriptorElement
+from smqtk_descriptors.utils.vector_retrieval import PARALLEL_RETRIEVAL_THRESHOLD
 
 
 @pytest.mark.skipif(not SolrDescriptorElement.is_usable(),
@@ -30,3 +32,33 @@ class TestDescriptorSolrElement (unittest.TestCase):
             assert i.solr_timeout == 101
             assert i.solr_persistent_connection is True
             assert i.solr_commit_on_set is False
+
+    @mock.patch('smqtk_descriptors.utils.vector_retrieval.parallel_map',
+                side_effect=lambda fn, it, **_: map(fn, it))
+    @mock.patch("solr.Solr")
+    def test_get_many_vectors(self, _mock_solr: mock.MagicMock, m_pmap: mock.MagicMock) -> None:
+        # Each vector is a separate Solr query, so batches should be
+        # retrieved in parallel.
+        ds = [
+            SolrDescriptorElement(i, self.TEST_URL, 'uuid_s', 'vector_fs', 'timestamp_f')
+            for i in range(PARALLEL_RETRIEVAL_THRESHOLD)
+        ]
+        for i, d in enumerate(ds):
+            # noinspection PyTypeHints
+            d.vector = mock.Mock(return_value=numpy.full(4, i))  # type: ignore
+        r = SolrDescriptorElement.get_many_vectors(ds)
+        m_pmap.assert_called_once()
+        for i, v in enumerate(r):
+            numpy.testing.assert_equal(v, numpy.full(4, i))
+
+    @mock.patch('smqtk_descriptors.utils.vector_retrieval.parallel_map')
+    @mock.patch("solr.Solr")
+    def test_get_many_vectors_small_batch_serial(self, _mock_solr: mock.MagicMock,
+                                                 m_pmap: mock.MagicMock) -> None:
+        # Batches under the threshold should not start parallel workers.
+        d = SolrDescriptorElement('a', self.TEST_URL, 'uuid_s', 'vector_fs', 'timestamp_f')
+        # noinspection PyTypeHints
+        d.vector = mock.Mock(return_value=numpy.zeros(4))  # type: ignore
+        r = SolrDescriptorElement.get_many_vectors([d])
+        numpy.testing.assert_equal(r[0], numpy.zeros(4))
+        m_pmap.assert_not_called()
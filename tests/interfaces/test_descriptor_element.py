@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
 import unittest.mock as mock
 import unittest
 
@@ -18,6 +18,24 @@ class DummyDescriptorElement (DescriptorElement):
     def vector(self) -> Optional[numpy.ndarray]: pass  # type: ignore
 
 
+class BulkDummyDescriptorElement (DummyDescriptorElement):
+    """
+    Dummy implementation providing bulk vector retrieval from a class-level
+    table of vectors.
+    """
+
+    TABLE: Dict[Hashable, numpy.ndarray] = {}
+
+    @classmethod
+    def _get_many_vectors_bulk(
+        cls,
+        descriptors: List[DescriptorElement]
+    ) -> Optional[Tuple[Iterable[Hashable], numpy.ndarray]]:
+        # Intentionally reversed order of the request.
+        uuids = [d.uuid() for d in reversed(descriptors) if d.uuid() in cls.TABLE]
+        return uuids, numpy.array([cls.TABLE[u] for u in uuids])
+
+
 class TestDescriptorElementAbstract (unittest.TestCase):
 
     def test_init(self) -> None:
@@ -36,6 +54,33 @@ class TestDescriptorElementAbstract (unittest.TestCase):
         self.assertTrue(de1 == de2)
         self.assertFalse(de1 != de2)
 
+    def test_equality_noVectors(self) -> None:
+        # Two elements that both lack a vector are considered equal.
+        de1 = DummyDescriptorElement('u1')
+        de2 = DummyDescriptorElement('u2')
+        # noinspection PyTypeHints
+        de1.vector = de2.vector = mock.Mock(return_value=None)  # type: ignore
+        # noinspection PyTypeHints
+        de1.has_vector = de2.has_vector = mock.Mock(return_value=False)  # type: ignore
+        self.assertTrue(de1 == de2)
+        # Only one of the two (shared) vector mocks calls should have occurred
+        # since the other element's vector need not be retrieved.
+        de1.vector.assert_called_once_with()
+
+    def test_nonEquality_oneVectorMissing(self) -> None:
+        de1 = DummyDescriptorElement('u1')
+        de2 = DummyDescriptorElement('u2')
+        # noinspection PyTypeHints
+        de1.vector = mock.Mock(return_value=numpy.random.randint(0, 10, 10))  # type: ignore
+        # noinspection PyTypeHints
+        de1.has_vector = mock.Mock(return_value=True)  # type: ignore
+        # noinspection PyTypeHints
+        de2.vector = mock.Mock(return_value=None)  # type: ignore
+        # noinspection PyTypeHints
+        de2.has_vector = mock.Mock(return_value=False)  # type: ignore
+        self.assertFalse(de1 == de2)
+        self.assertFalse(de2 == de1)
+
     def test_nonEquality_diffInstance(self) -> None:
         # diff instance
         de = DummyDescriptorElement('a')
@@ -74,6 +119,32 @@ class TestDescriptorElementAbstract (unittest.TestCase):
         self.assertFalse(d1 == d2)
         self.assertTrue(d1 != d2)
 
+    def test_equality_float_semantics(self) -> None:
+        # Floating point vectors compare by value, not by representation.
+        d1 = DummyDescriptorElement('a')
+        # noinspection PyTypeHints
+        d1.vector = mock.Mock(return_value=numpy.array([0.0, 1.0]))  # type: ignore
+        d2 = DummyDescriptorElement('b')
+        # noinspection PyTypeHints
+        d2.vector = mock.Mock(return_value=numpy.array([-0.0, 1.0]))  # type: ignore
+        self.assertTrue(d1 == d2)
+
+        # noinspection PyTypeHints
+        d1.vector = mock.Mock(return_value=numpy.array([numpy.nan]))  # type: ignore
+        # noinspection PyTypeHints
+        d2.vector = mock.Mock(return_value=numpy.array([numpy.nan]))  # type: ignore
+        self.assertFalse(d1 == d2)
+
+    def test_equality_non_contiguous(self) -> None:
+        v = numpy.random.randint(0, 10, 20)
+        d1 = DummyDescriptorElement('a')
+        # noinspection PyTypeHints
+        d1.vector = mock.Mock(return_value=v[::2])  # type: ignore
+        d2 = DummyDescriptorElement('b')
+        # noinspection PyTypeHints
+        d2.vector = mock.Mock(return_value=v[::2].copy())  # type: ignore
+        self.assertTrue(d1 == d2)
+
     def test_get_many_vectors(self) -> None:
         v1 = numpy.random.randint(0, 10, 10)
         v2 = numpy.random.randint(0, 10, 100)
@@ -90,6 +161,125 @@ class TestDescriptorElementAbstract (unittest.TestCase):
         for retrieved, expected in zip(retrieved_vectors, [v1, v2]):
             numpy.testing.assert_array_equal(retrieved, expected)  # type: ignore
 
+    def test_get_many_vectors_mixed_types(self) -> None:
+        class OtherDummyDescriptorElement (DummyDescriptorElement):
+            pass
+
+        v1 = numpy.random.randint(0, 10, 10)
+        v3 = numpy.random.randint(0, 10, 10)
+
+        d1 = DummyDescriptorElement('a')
+        # noinspection PyTypeHints
+        d1.vector = mock.Mock(return_value=v1)  # type: ignore
+
+        d2 = OtherDummyDescriptorElement('b')
+        # noinspection PyTypeHints
+        d2.vector = mock.Mock(return_value=None)  # type: ignore
+
+        d3 = OtherDummyDescriptorElement('c')
+        # noinspection PyTypeHints
+        d3.vector = mock.Mock(return_value=v3)  # type: ignore
+
+        retrieved_vectors = DescriptorElement.get_many_vectors([d1, d2, d3])
+        self.assertEqual(len(retrieved_vectors), 3)
+        numpy.testing.assert_array_equal(retrieved_vectors[0], v1)  # type: ignore
+        self.assertIsNone(retrieved_vectors[1])
+        numpy.testing.assert_array_equal(retrieved_vectors[2], v3)  # type: ignore
+
+    def test_get_many_vectors_empty(self) -> None:
+        self.assertEqual(DescriptorElement.get_many_vectors([]), [])
+
+    def test_get_many_vectors_array(self) -> None:
+        v1 = numpy.random.randint(0, 10, 10)
+        v3 = numpy.random.randint(0, 10, 10)
+
+        d1 = DummyDescriptorElement('a')
+        # noinspection PyTypeHints
+        d1.vector = mock.Mock(return_value=v1)  # type: ignore
+
+        d2 = DummyDescriptorElement('b')
+        # noinspection PyTypeHints
+        d2.vector = mock.Mock(return_value=None)  # type: ignore
+
+        d3 = DummyDescriptorElement('c')
+        # noinspection PyTypeHints
+        d3.vector = mock.Mock(return_value=v3)  # type: ignore
+
+        matrix, missing = DescriptorElement.get_many_vectors_array([d1, d2, d3])
+        self.assertEqual(matrix.shape, (3, 10))
+        self.assertEqual(matrix.dtype, v1.dtype)
+        numpy.testing.assert_array_equal(missing, [False, True, False])
+        numpy.testing.assert_array_equal(matrix[0], v1)
+        numpy.testing.assert_array_equal(matrix[1], numpy.zeros(10))
+        numpy.testing.assert_array_equal(matrix[2], v3)
+
+        matrix, _ = DescriptorElement.get_many_vectors_array([d1, d3], dtype=numpy.dtype('float32'))
+        self.assertEqual(matrix.dtype, numpy.float32)
+        numpy.testing.assert_array_equal(matrix, [v1, v3])
+
+    def test_get_many_vectors_as_array(self) -> None:
+        d = DummyDescriptorElement('a')
+        # noinspection PyTypeHints
+        d.vector = mock.Mock(return_value=numpy.arange(3))  # type: ignore
+        matrix, missing = DescriptorElement.get_many_vectors([d], as_array=True)
+        numpy.testing.assert_array_equal(matrix, [[0, 1, 2]])
+        numpy.testing.assert_array_equal(missing, [False])
+
+        # A non-literal flag is accepted as well.
+        as_array: bool = False
+        r = DescriptorElement.get_many_vectors([d], as_array=as_array)
+        assert isinstance(r, list)
+        numpy.testing.assert_array_equal(r[0], [0, 1, 2])  # type: ignore
+
+    def test_get_many_vectors_array_no_vectors(self) -> None:
+        d = DummyDescriptorElement('a')
+        # noinspection PyTypeHints
+        d.vector = mock.Mock(return_value=None)  # type: ignore
+        matrix, missing = DescriptorElement.get_many_vectors_array([d])
+        self.assertEqual(matrix.shape, (1, 0))
+        numpy.testing.assert_array_equal(missing, [True])
+
+    def test_get_many_vectors_array_shape_mismatch(self) -> None:
+        d1 = DummyDescriptorElement('a')
+        # noinspection PyTypeHints
+        d1.vector = mock.Mock(return_value=numpy.ones(10))  # type: ignore
+        d2 = DummyDescriptorElement('b')
+        # noinspection PyTypeHints
+        d2.vector = mock.Mock(return_value=numpy.ones(1))  # type: ignore
+        with self.assertRaises(ValueError):
+            DescriptorElement.get_many_vectors_array([d1, d2])
+
+    @mock.patch.object(BulkDummyDescriptorElement, 'TABLE', {
+        'a': numpy.arange(4), 'c': numpy.arange(4, 8)
+    })
+    def test_get_many_vectors_bulk(self) -> None:
+        d_a = BulkDummyDescriptorElement('a')
+        d_b = BulkDummyDescriptorElement('b')
+        d_c = BulkDummyDescriptorElement('c')
+        d_other = DummyDescriptorElement('o')
+        # noinspection PyTypeHints
+        d_other.vector = mock.Mock(return_value=numpy.arange(8, 12))  # type: ignore
+
+        descriptors = [d_c, d_b, d_other, d_a, d_c]
+        expected = [numpy.arange(4, 8), None, numpy.arange(8, 12), numpy.arange(4), numpy.arange(4, 8)]
+
+        vectors = DescriptorElement.get_many_vectors(descriptors)
+        self.assertEqual(len(vectors), len(expected))
+        for v, e in zip(vectors, expected):
+            if e is None:
+                self.assertIsNone(v)
+            else:
+                numpy.testing.assert_array_equal(v, e)  # type: ignore
+        # Duplicate descriptors receive independent vectors.
+        assert vectors[0] is not None and vectors[4] is not None
+        self.assertFalse(numpy.shares_memory(vectors[0], vectors[4]))
+
+        matrix, missing = DescriptorElement.get_many_vectors_array(descriptors)
+        numpy.testing.assert_array_equal(missing, [False, True, False, False, False])
+        numpy.testing.assert_array_equal(matrix, [
+            numpy.arange(4, 8), numpy.zeros(4), numpy.arange(8, 12), numpy.arange(4), numpy.arange(4, 8)
+        ])
+
     def test_hash(self) -> None:
         # Hash of a descriptor element is solely based on the UUID value of
         # that element.
@@ -126,3 +316,5 @@ class TestDescriptorElementAbstract (unittest.TestCase):
         }
         e.__setstate__(state)
         self.assertEqual(e._uuid, expected_uid)
+        # Cached hash must track the restored UUID.
+        self.assertEqual(hash(e), hash(expected_uid))